@@ -1,11 +1,20 @@
 import argparse
+import collections
+import functools
 import sys
 import os
 import platform
-from arabic_reshaper import ArabicReshaper
-from bidi.algorithm import get_display
+import re
+import types
+import unicodedata
 import arabic_conjugator_hmolavi as ac
 
+# --- Unicode Constants for Arabic Harakat ---
+FATHA = "\u064e"  # یَ
+DAMMA = "\u064f"  # یُ
+KASRA = "\u0650"  # یِ
+SUKUN = "\u0652"  # یْ
+
 # Module-level override: when None, use heuristics; when True/False, force terminal reversal behavior
 FORCE_REVERSE_TERMINAL = None
 # Module-level override for GUI reversal: None => use heuristics, True/False => force behavior
@@ -23,7 +32,12 @@ def should_reverse_terminal_text():
     # If the CLI/user asked to force a behavior, honor that first
     if FORCE_REVERSE_TERMINAL is not None:
         return bool(FORCE_REVERSE_TERMINAL)
+    return _detect_terminal_reverse()
+
 
+@functools.lru_cache(maxsize=None)
+def _detect_terminal_reverse():
+    """Environment heuristic behind should_reverse_terminal_text(); cached since the environment is fixed per run."""
     # --- Check for modern Windows Terminal ---
     if os.environ.get("WT_SESSION"):
         return False
@@ -46,20 +60,72 @@ def should_reverse_gui_text():
               that requires a fix. False otherwise.
     """
     # CLI/GUI override takes precedence when set
-    if "FORCE_REVERSE_GUI" in globals() and globals().get("FORCE_REVERSE_GUI") is not None:
-        return bool(globals().get("FORCE_REVERSE_GUI"))
+    if FORCE_REVERSE_GUI is not None:
+        return bool(FORCE_REVERSE_GUI)
+    return _detect_gui_reverse()
+
+
+@functools.lru_cache(maxsize=None)
+def _detect_gui_reverse():
+    """Platform heuristic behind should_reverse_gui_text(); cached since the platform never changes."""
     return platform.system() == "Linux"
 
 
-def format_text_gui(text):
-    """Return a GUI-ready string: reshape + bidi if GUI environment requires it and reshaper is available."""
+# Any character from the Arabic, Arabic Supplement or Arabic Presentation Forms-A/B blocks;
+# text without one needs no reshaping or reordering
+_ARABIC_RE = re.compile("[\u0600-\u06ff\u0750-\u077f\ufb50-\ufdff\ufe70-\ufeff]")
+
+
+# arabic_reshaper settings per target; GUI widgets keep harakat in place, terminals need them shifted.
+# Read when the reshapers are first built (see _load_shaping), so adjust them before any text is formatted.
+GUI_RESHAPER_CONFIG = {"delete_harakat": False, "shift_harakat_position": False}
+TERMINAL_RESHAPER_CONFIG = {"delete_harakat": False, "shift_harakat_position": True}
+
+
+@functools.lru_cache(maxsize=None)
+def _load_shaping():
+    """Import the shaping libraries on first use and build the reshapers once.
+
+    Imported lazily so runs that never reshape (smart terminals, --help) skip loading them.
+
+    Returns:
+        tuple | None: (gui_reshaper, terminal_reshaper, get_display), or None when arabic_reshaper /
+                      python-bidi are not installed and the formatters fall back to logical text.
+    """
+    try:
+        from arabic_reshaper import ArabicReshaper
+        from bidi.algorithm import get_display
+    except ImportError:
+        return None
+    gui_reshaper = ArabicReshaper(configuration=dict(GUI_RESHAPER_CONFIG))
+    terminal_reshaper = ArabicReshaper(configuration=dict(TERMINAL_RESHAPER_CONFIG))
+    return gui_reshaper, terminal_reshaper, get_display
+
+
+@functools.lru_cache(maxsize=1024)
+def _reshape_visual(text, for_terminal):
+    """Reshape + bidi-reorder text for the GUI or the terminal. Pure, so results are cached per (text, target)."""
+    gui_reshaper, terminal_reshaper, get_display = _load_shaping()
+    reshaper = terminal_reshaper if for_terminal else gui_reshaper
+    return get_display(reshaper.reshape(text))
+
+
+def format_text_gui(text, reverse=None):
+    """Return a GUI-ready string: reshape + bidi if GUI environment requires it and reshaper is available.
+
+    reverse overrides should_reverse_gui_text() for callers rendering for an explicit reversal state.
+    """
     if not text:
         return text
-    if not should_reverse_gui_text():
+    if reverse is None:
+        reverse = should_reverse_gui_text()
+    if not reverse or _load_shaping() is None:
+        return text
+    text = str(text)
+    if not _ARABIC_RE.search(text):
         return text
     try:
-        cfg = {"delete_harakat": False, "shift_harakat_position": False}
-        return get_display(ArabicReshaper(configuration=cfg).reshape(str(text)))
+        return _reshape_visual(text, False)
     except Exception:
         pass
     return text
@@ -69,37 +135,133 @@ def format_text_terminal(text):
     """Return a terminal-ready string: reshape + bidi if terminal requires it and reshaper available."""
     if not text:
         return text
-    if not should_reverse_terminal_text():
+    if not should_reverse_terminal_text() or _load_shaping() is None:
+        return text
+    text = str(text)
+    if not _ARABIC_RE.search(text):
         return text
     try:
-        cfg = {"delete_harakat": False, "shift_harakat_position": True}
-        return get_display(ArabicReshaper(configuration=cfg).reshape(str(text)))
+        return _reshape_visual(text, True)
     except Exception:
         pass
     return text
 
 
+def write_stdout(text):
+    """Write a fully built block of output to stdout as UTF-8 bytes in one call.
+
+    Falls back to sys.stdout.write when stdout has no binary buffer (e.g. replaced by a StringIO).
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(text)
+        return
+    # Flush pending text first so earlier print() output stays in order
+    sys.stdout.flush()
+    buffer.write(text.encode("utf-8"))
+    buffer.flush()
+
+
+# Dropped from verb input: tatweel (U+0640) only stretches letters, but the parser would count it as a root letter.
+# Hamza-bearing alefs etc. are deliberately not unified since they are real root letters (e.g. أَكَلَ).
+_INPUT_DELETE = str.maketrans("", "", "\u0640")
+
+
+def normalize_input(text):
+    """Return text in NFC form without tatweel, using the Unicode quick check to skip normalizing already-composed input."""
+    if not text:
+        return text
+    text = text.translate(_INPUT_DELETE)
+    if unicodedata.is_normalized("NFC", text):
+        return text
+    return unicodedata.normalize("NFC", text)
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_root_cached(raw, reverse=False):
+    """Memoized wrapper around ac.parse_root. Parse errors are raised every time, never cached."""
+    return ac.parse_root(raw, reverse=reverse)
+
+
+@functools.lru_cache(maxsize=512)
+def conjugate_verb_cached(verb, tense="past", bab_key=None, mood=None, reverse_input=False):
+    """Memoized wrapper around ac.conjugate_verb.
+
+    Returns (title, forms) with forms as a tuple so the cached value can be shared safely
+    between repeated Conjugate clicks and CLI calls with identical inputs.
+    """
+    title, forms = ac.conjugate_verb(verb, tense=tense, bab_key=bab_key, mood=mood, reverse_input=reverse_input)
+    return title, tuple(forms)
+
+
 # Delay tkinter imports until GUI is actually needed so the script can run
-# in environments without tkinter (headless/CLI mode).
-try:
-    import tkinter as tk
-    from tkinter import ttk, scrolledtext
-except Exception:
-    # We'll only require tkinter if GUI mode is selected (no CLI args).
-    tk = None
-    ttk = None
-    scrolledtext = None
+# in environments without tkinter (headless/CLI mode) and CLI runs skip loading Tk.
+tk = None
+ttk = None
+scrolledtext = None
+tkfont = None
+
+
+def _load_tkinter():
+    """Import tkinter into the module globals for GUI mode. Returns False if it is unavailable."""
+    global tk, ttk, scrolledtext, tkfont
+    if tk is not None:
+        return True
+    try:
+        import tkinter as tk
+        from tkinter import ttk, scrolledtext
+        from tkinter import font as tkfont
+    except Exception:
+        # We'll only require tkinter if GUI mode is selected (no CLI args).
+        tk = None
+        return False
+    return True
+
+
+def _group_pronoun_indices(pronouns):
+    """Map person_gender -> number -> tuple of result indices, following the order of pronouns."""
+    groups = {}
+    for idx, (_, _, person_gender, num) in enumerate(pronouns):
+        groups.setdefault(person_gender, {}).setdefault(num, []).append(idx)
+    return {pg: {num: tuple(idxs) for num, idxs in nums.items()} for pg, nums in groups.items()}
+
+
+def _table_layout(groups, display_order):
+    """Flatten grouped indices into table rows: (person_gender, (plural, dual, singular) index tuples)."""
+    return tuple(
+        (pg, tuple(groups.get(pg, {}).get(num, ()) for num in ("Plural", "Dual", "Singular"))) for pg in display_order
+    )
+
+
+# An entry of the example-verb dropdown: the verb and the bab it conjugates with
+ExampleVerb = collections.namedtuple("ExampleVerb", "verb bab")
+
+
+# Static GUI label texts by widget role; formatted per reversal state via ArabicConjugatorApp._gui_labels()
+_UI_STRINGS = {
+    "enter_verb": "1. Enter Past Tense Verb (In هُوَ form, with harakat, e.g., ذَهَبَ):",
+    "clear": "Clear",
+    "select_tense": "2. Select Tense:",
+    "past": "Past (الماضي)",
+    "present": "Present (المضارع)",
+    "select_bab": "3a. Select Pattern (Bab):",
+    "select_mood": "3b. Select Mood:",
+    "conjugate": "Conjugate Verb",
+    "output": "Conjugation Output:",
+    "font_size": "Font Size:",
+    "double_spacing": "Double Spacing",
+}
 
 
 class ArabicConjugatorApp:
-    # --- Unicode Constants for Arabic Harakat ---
-    FATHA = "\u064e"  # یَ
-    DAMMA = "\u064f"  # یُ
-    KASRA = "\u0650"  # یِ
-    SUKUN = "\u0652"  # یْ
+    # Harakat constants, aliased from module level so existing self.FATHA-style access keeps working
+    FATHA = FATHA
+    DAMMA = DAMMA
+    KASRA = KASRA
+    SUKUN = SUKUN
 
     # The 14 pronouns/forms
-    PRONOUNS = [
+    PRONOUNS = (
         ("هو", "He (M. Sing.)", "3rd person male", "Singular"),
         ("هما (M)", "They (M. Dual)", "3rd person male", "Dual"),
         ("هم", "They (M. Pl.)", "3rd person male", "Plural"),
@@ -114,51 +276,100 @@ class ArabicConjugatorApp:
         ("أنتن", "You (F. Pl.)", "2nd person female", "Plural"),
         ("أنا", "I", "1st person", "Singular"),
         ("نحن", "We", "1st person", "Plural"),
-    ]
+    )
+
+    # Static (person_gender, number) -> result-index layout used by the output tables
+    _GROUP_INDICES = _group_pronoun_indices(PRONOUNS)
+    # Row order of the tables; the GUI renders the "1st person" row separately (it has no dual)
+    _TERM_DISPLAY_ORDER = ("3rd person male", "3rd person female", "2nd person male", "2nd person female", "1st person")
+    # Per row: (person_gender, (plural, dual, singular) result indices), so rendering is plain tuple indexing
+    _TABLE_LAYOUT = _table_layout(_GROUP_INDICES, _TERM_DISPLAY_ORDER)
+    # Font shared by the labels, buttons, radio buttons and comboboxes
+    _UI_FONT = ("Arial", 12)
+    # Horizontal rules of the 77-column terminal table
+    _TERM_RULE = "=" * 77 + "\n"
+    _TERM_THIN_RULE = "-" * 77 + "\n"
+    # Column headings, centered to the column widths
+    _TERM_HEADER = "{0:^{p}} | {1:^{d}} | {2:^{s}} | {3:^{per}}\n".format(
+        "Plural",
+        "Dual",
+        "Singular",
+        "Person",
+        p=16,
+        d=13,
+        s=13,
+        per=16,
+    )
+    # One row of the terminal table; lead/pad are the column paddings (see _format_terminal)
+    _TERM_ROW_FMT = "{lead}{plural}\t\t l {dual}{pad}  \t{lead} l {singular}  \t{lead} l {person} \n"
 
-    # The 6 major conjugation patterns (Babs)
-    BABS = {
+    # GUI reversal state -> (last-column padding, separator, header) of the GUI table
+    _GUI_TABLE_FRAME = {
+        reverse: (pad, "—" * sep_len + "\n", f"| Plural\t| Dual\t| Singular\t|{pad}|\n")
+        for reverse, pad, sep_len in ((False, "\t\t", 24), (True, "\t\t\t", 30))
+    }
+
+    # The 6 major conjugation patterns (Babs); read-only since it is shared class state
+    BABS = types.MappingProxyType({
         "Fatha/Fatha (فَتَحَ / يَفْتَحُ)": (FATHA, FATHA),
         "Fatha/Damma (نَصَرَ / يَنْصُرُ)": (FATHA, DAMMA),
         "Fatha/Kasra (ضَرَبَ / يَضْرِبُ)": (FATHA, KASRA),
         "Kasra/Fatha (سَمِعَ / يَسْمَعُ)": (KASRA, FATHA),
         "Damma/Damma (كَرُمَ / يَكْرُمُ)": (DAMMA, DAMMA),
         "Kasra/Kasra (حَسِبَ / يَحْسِبُ)": (KASRA, KASRA),
-    }
+    })
+    _BAB_KEYS = tuple(BABS)
+    _DEFAULT_BAB = _BAB_KEYS[0]
+
+    EXAMPLE_VERBS = (
+        ExampleVerb("فَعَلَ", "Fatha/Fatha (فَتَحَ / يَفْتَحُ)"),
+        ExampleVerb("ذَهَبَ", "Fatha/Fatha (فَتَحَ / يَفْتَحُ)"),
+        ExampleVerb("كَتَبَ", "Fatha/Damma (نَصَرَ / يَنْصُرُ)"),
+        ExampleVerb("جَلَسَ", "Fatha/Kasra (ضَرَبَ / يَضْرِبُ)"),
+        ExampleVerb("شَرِبَ", "Kasra/Fatha (سَمِعَ / يَسْمَعُ)"),
+        ExampleVerb("كَرُمَ", "Damma/Damma (كَرُمَ / يَكْرُمُ)"),
+        ExampleVerb("حَسِبَ", "Kasra/Kasra (حَسِبَ / يَحْسِبُ)"),
+        ExampleVerb("قَرَأَ", "Fatha/Fatha (فَتَحَ / يَفْتَحُ)"),
+        ExampleVerb("أَكَلَ", "Fatha/Damma (نَصَرَ / يَنْصُرُ)"),
+        ExampleVerb("دَخَلَ", "Fatha/Damma (نَصَرَ / يَنْصُرُ)"),
+    )
+    # Store examples in NFC, the same form normalize_input() gives typed input, so lookups line up
+    EXAMPLE_VERBS = tuple(item._replace(verb=normalize_input(item.verb)) for item in EXAMPLE_VERBS)
 
-    EXAMPLE_VERBS = [
-        {"verb": "فَعَلَ", "bab": "Fatha/Fatha (فَتَحَ / يَفْتَحُ)"},
-        {"verb": "ذَهَبَ", "bab": "Fatha/Fatha (فَتَحَ / يَفْتَحُ)"},
-        {"verb": "كَتَبَ", "bab": "Fatha/Damma (نَصَرَ / يَنْصُرُ)"},
-        {"verb": "جَلَسَ", "bab": "Fatha/Kasra (ضَرَبَ / يَضْرِبُ)"},
-        {"verb": "شَرِبَ", "bab": "Kasra/Fatha (سَمِعَ / يَسْمَعُ)"},
-        {"verb": "كَرُمَ", "bab": "Damma/Damma (كَرُمَ / يَكْرُمُ)"},
-        {"verb": "حَسِبَ", "bab": "Kasra/Kasra (حَسِبَ / يَحْسِبُ)"},
-        {"verb": "قَرَأَ", "bab": "Fatha/Fatha (فَتَحَ / يَفْتَحُ)"},
-        {"verb": "أَكَلَ", "bab": "Fatha/Damma (نَصَرَ / يَنْصُرُ)"},
-        {"verb": "دَخَلَ", "bab": "Fatha/Damma (نَصَرَ / يَنْصُرُ)"},
-    ]
-
-    MOODS = [
+    # Logical verb -> example entry, for O(1) lookup when an example is picked
+    _EXAMPLE_VERB_INDEX = {item.verb: item for item in EXAMPLE_VERBS}
+
+    # GUI reversal state -> {label: display string} for the static combobox labels (see _gui_labels)
+    _GUI_LABELS = {}
+    # GUI reversal state -> (example display values, display -> logical verb map) (see _example_choices)
+    _EXAMPLE_CHOICES = {}
+
+    MOODS = (
         ("Indicative (مرفوع)", "Indicative (مرفوع)"),
         ("Subjunctive (منصوب)", "Subjunctive (منصوب)"),
         ("Imperative (أمر)", "Imperative (أمر)"),
         ("Jussive (مجزوم)", "Jussive (مجزوم)"),
-    ]
+    )
+    _DEFAULT_MOOD = MOODS[0][1]
 
     def __init__(self, master):
         self.master = master
         master.title("Arabic Verb Conjugator")
 
         self.style = ttk.Style()
-        self.style.configure("TButton", font=("Arial", 12))
-        self.style.configure("TLabel", font=("Arial", 12))
-        self.style.configure("TRadiobutton", font=("Arial", 12))
-        self.style.configure("TCombobox", font=("Arial", 12))
+        # Labels, buttons and radio buttons take their font from these styles instead of per widget
+        self.style.configure("TButton", font=self._UI_FONT)
+        self.style.configure("TLabel", font=self._UI_FONT)
+        self.style.configure("TRadiobutton", font=self._UI_FONT)
+        self.style.configure("TCombobox", font=self._UI_FONT)
 
         self.tense_var = tk.StringVar(value="Past")
-        self.mood_var = tk.StringVar(value="Indicative (مرفوع)")
-        self.bab_var = tk.StringVar(value=list(self.BABS.keys())[0])
+        self.mood_var = tk.StringVar(value=self._DEFAULT_MOOD)
+        self.bab_var = tk.StringVar(value=self._DEFAULT_BAB)
+
+        # All static texts are reshaped in one batch up front rather than widget by widget
+        labels = self._gui_labels()
+        ui = {role: labels[text] for role, text in _UI_STRINGS.items()}
 
         main_frame = ttk.Frame(master, padding="10")
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -167,24 +378,18 @@ class ArabicConjugatorApp:
 
         ttk.Label(
             main_frame,
-            text=format_text_gui("1. Enter Past Tense Verb (In هُوَ form, with harakat, e.g., ذَهَبَ):"),
-            font=(
-                "Arial",
-                12,
-            ),
+            text=ui["enter_verb"],
         ).grid(row=0, column=0, sticky=tk.W, pady=5)
         self.root_entry = ttk.Entry(main_frame, font=("Arial", 16), justify="right", width=20)
         self.root_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=5)
 
-        self.clear_button = ttk.Button(main_frame, text=format_text_gui("Clear"), command=lambda: self.root_entry.delete(0, tk.END))
+        self.clear_button = ttk.Button(main_frame, text=ui["clear"], command=lambda: self.root_entry.delete(0, tk.END))
         self.clear_button.grid(row=0, column=2, padx=5)
 
         self.example_verb_var = tk.StringVar()
-        # Transform example verbs if GUI needs it
-        example_values = [format_text_gui(v["verb"]) for v in self.EXAMPLE_VERBS]
-        # Map displayed example string back to logical verb for selection handling
-        self._example_display_map = {display: logical["verb"] for display, logical in zip(example_values, self.EXAMPLE_VERBS)}
-        self.example_verb_combo = ttk.Combobox(main_frame, textvariable=self.example_verb_var, values=example_values, font=("Arial", 12), width=10)
+        # Example verbs as displayed (transformed if the GUI needs it), plus the map back to the logical verb
+        example_values, self._example_display_map = self._example_choices()
+        self.example_verb_combo = ttk.Combobox(main_frame, textvariable=self.example_verb_var, values=example_values, font=self._UI_FONT, width=10)
         self.example_verb_combo.grid(row=0, column=3, padx=5)
         self.example_verb_combo.set("Examples")
         self.example_verb_combo.bind("<<ComboboxSelected>>", self.on_example_verb_select)
@@ -200,18 +405,14 @@ class ArabicConjugatorApp:
         tense_frame.grid(row=1, column=0, columnspan=4, sticky=tk.W, pady=5)
         ttk.Label(
             tense_frame,
-            text=format_text_gui("2. Select Tense:"),
-            font=(
-                "Arial",
-                12,
-            ),
+            text=ui["select_tense"],
         ).pack(side=tk.LEFT)
         ttk.Radiobutton(
-            tense_frame, text=format_text_gui("Past (الماضي)"), variable=self.tense_var, value="Past", command=self.update_present_options
+            tense_frame, text=ui["past"], variable=self.tense_var, value="Past", command=self.update_present_options
         ).pack(side=tk.LEFT, padx=5)
         ttk.Radiobutton(
             tense_frame,
-            text=format_text_gui("Present (المضارع)"),
+            text=ui["present"],
             variable=self.tense_var,
             value="Present",
             command=self.update_present_options,
@@ -221,39 +422,34 @@ class ArabicConjugatorApp:
 
         ttk.Label(
             self.present_frame,
-            text=format_text_gui("3a. Select Pattern (Bab):"),
-            font=(
-                "Arial",
-                12,
-            ),
+            text=ui["select_bab"],
         ).grid(row=0, column=0, sticky=tk.W, pady=2, padx=5)
         # Transform BABS keys if necessary
-        bab_values = [format_text_gui(k) for k in list(self.BABS.keys())]
+        bab_values = [labels[k] for k in self._BAB_KEYS]
         self.bab_combo = ttk.Combobox(self.present_frame, textvariable=self.bab_var, values=bab_values, font=("Arial", 11), state="readonly")
         self.bab_combo.grid(row=0, column=1, columnspan=2, sticky=(tk.W, tk.E), padx=5)
 
         ttk.Label(
             self.present_frame,
-            text=format_text_gui("3b. Select Mood:"),
-            font=(
-                "Arial",
-                12,
-            ),
+            text=ui["select_mood"],
         ).grid(row=1, column=0, sticky=tk.W, pady=2, padx=5)
         # Create radio buttons from the MOODS list so it's easy to add more options later
         for idx, (label, value) in enumerate(self.MOODS, start=1):
-            ttk.Radiobutton(self.present_frame, text=format_text_gui(label), variable=self.mood_var, value=value).grid(row=idx, column=1, sticky=tk.W)
+            ttk.Radiobutton(self.present_frame, text=labels[label], variable=self.mood_var, value=value).grid(row=idx, column=1, sticky=tk.W)
 
+        # Place the frame once; update_present_options() then only hides/re-shows it, keeping these grid options
+        self.present_frame.grid(row=2, column=0, columnspan=4, sticky=(tk.W, tk.E), pady=5)
         self.update_present_options()
 
-        self.conjugate_button = ttk.Button(main_frame, text=format_text_gui("Conjugate Verb"), command=self.calculate_conjugation, style="TButton")
+        self.conjugate_button = ttk.Button(main_frame, text=ui["conjugate"], command=self.calculate_conjugation, style="TButton")
         self.conjugate_button.grid(row=3, column=0, columnspan=4, pady=10)
 
         self.font_size_var = tk.StringVar(value="18")
         self.double_spacing_var = tk.BooleanVar(value=False)
         self.last_results = None
-        self.last_term_results = None
         self.last_title = ""
+        # Inputs behind last_results, so an unchanged re-submit can skip the redraw
+        self._last_state = None
 
         controls_frame = ttk.Frame(main_frame)
         controls_frame.grid(row=4, column=0, columnspan=4, sticky=(tk.W, tk.E), pady=5)
@@ -261,11 +457,7 @@ class ArabicConjugatorApp:
         # Conjugation Output label and a small toggle icon/button to force GUI reversal
         ttk.Label(
             controls_frame,
-            text=format_text_gui("Conjugation Output:"),
-            font=(
-                "Arial",
-                12,
-            ),
+            text=ui["output"],
         ).pack(side=tk.LEFT)
 
         # Toggle button for GUI reversal (shows current state via text)
@@ -278,7 +470,7 @@ class ArabicConjugatorApp:
         )
         self.gui_reverse_button.pack(side=tk.RIGHT, padx=(6, 8))
 
-        ttk.Label(controls_frame, text=format_text_gui("Font Size:")).pack(side=tk.LEFT, padx=(10, 2))
+        ttk.Label(controls_frame, text=ui["font_size"]).pack(side=tk.LEFT, padx=(10, 2))
         self.font_size_combo = ttk.Combobox(
             controls_frame, textvariable=self.font_size_var, values=[12, 14, 16, 18, 20, 22, 24, 26, 28, 30, 48], width=4, state="readonly"
         )
@@ -286,20 +478,48 @@ class ArabicConjugatorApp:
         self.font_size_combo.bind("<<ComboboxSelected>>", self.update_font_size)
 
         self.spacing_check = ttk.Checkbutton(
-            controls_frame, text=format_text_gui("Double Spacing"), variable=self.double_spacing_var, command=self.redisplay_results
+            controls_frame, text=ui["double_spacing"], variable=self.double_spacing_var, command=self.update_row_spacing
         )
         self.spacing_check.pack(side=tk.LEFT, padx=10)
 
+        # Named fonts for the output; update_font_size() resizes them in place
+        self._output_font = tkfont.Font(family="Arial", size=18)
+        self._header_font = tkfont.Font(family="Arial", size=18, weight="bold")
         self.output_text = scrolledtext.ScrolledText(
-            main_frame, wrap=tk.WORD, width=60, height=20, font=("Arial", 18), **{"bd": 1, "relief": tk.SOLID}
+            main_frame, wrap=tk.WORD, width=60, height=20, font=self._output_font, **{"bd": 1, "relief": tk.SOLID}
         )
         self.output_text.grid(row=5, column=0, columnspan=4, sticky=(tk.W, tk.E, tk.N, tk.S))
-        self.output_text.tag_configure("header", font=("Arial", 18, "bold"), justify="center")
+        self.output_text.tag_configure("header", font=self._header_font, justify="center")
         self.output_text.tag_configure("rtl_output", justify="right")
+        # Data rows of the table carry this tag; double spacing is its spacing3, so toggling it needs no re-render
+        self.output_text.tag_configure("table_row", spacing3=0)
 
         main_frame.columnconfigure(1, weight=1)
         main_frame.rowconfigure(5, weight=1)
 
+    @classmethod
+    def _gui_labels(cls):
+        """Return display strings for the static GUI texts (examples, babs, moods, labels), reshaped once per GUI reversal state."""
+        reverse = should_reverse_gui_text()
+        labels = cls._GUI_LABELS.get(reverse)
+        if labels is None:
+            texts = [v.verb for v in cls.EXAMPLE_VERBS] + list(cls._BAB_KEYS)
+            texts += [label for label, _ in cls.MOODS] + list(_UI_STRINGS.values())
+            labels = cls._GUI_LABELS[reverse] = {text: format_text_gui(text) for text in texts}
+        return labels
+
+    @classmethod
+    def _example_choices(cls):
+        """Return (display values, display -> logical verb map) for the example dropdown, built once per GUI reversal state."""
+        reverse = should_reverse_gui_text()
+        choices = cls._EXAMPLE_CHOICES.get(reverse)
+        if choices is None:
+            labels = cls._gui_labels()
+            values = tuple(labels[v.verb] for v in cls.EXAMPLE_VERBS)
+            display_map = types.MappingProxyType({labels[v.verb]: v.verb for v in cls.EXAMPLE_VERBS})
+            choices = cls._EXAMPLE_CHOICES[reverse] = (values, display_map)
+        return choices
+
     def on_example_verb_select(self, event=None):
         selected_verb_str = self.example_verb_var.get()
         if not selected_verb_str or selected_verb_str == "Examples":
@@ -320,24 +540,23 @@ class ArabicConjugatorApp:
         self.root_entry.insert(0, display_value)
 
         # Also set the bab selection if available
-        matched = next((item for item in self.EXAMPLE_VERBS if item["verb"] == logical), None)
+        matched = self._EXAMPLE_VERB_INDEX.get(logical)
         if matched:
-            self.bab_var.set(matched["bab"])
+            self.bab_var.set(matched.bab)
 
     def _apply_gui_formatting(self):
         """Apply GUI formatting to labels, buttons and combobox display values according to should_reverse_gui_text()."""
+        labels = self._gui_labels()
         # Update example combobox display values
         try:
-            example_values = [format_text_gui(v["verb"]) for v in self.EXAMPLE_VERBS]
+            example_values, self._example_display_map = self._example_choices()
             self.example_verb_combo.configure(values=example_values)
-            # Rebuild display->logical map
-            self._example_display_map = {display: logical["verb"] for display, logical in zip(example_values, self.EXAMPLE_VERBS)}
         except Exception:
             pass
 
         # Update bab combobox display values
         try:
-            bab_values = [format_text_gui(k) for k in list(self.BABS.keys())]
+            bab_values = [labels[k] for k in self._BAB_KEYS]
             self.bab_combo.configure(values=bab_values)
         except Exception:
             pass
@@ -359,10 +578,9 @@ class ArabicConjugatorApp:
 
         This flips the FORCE_REVERSE_GUI module-level override and reapplies GUI formatting.
         """
-        current = bool(globals().get("FORCE_REVERSE_GUI")) if globals().get("FORCE_REVERSE_GUI") is not None else None
+        global FORCE_REVERSE_GUI
         # Flip: if None or False => True; if True => False
-        new = not current if isinstance(current, bool) else True
-        globals()["FORCE_REVERSE_GUI"] = new
+        FORCE_REVERSE_GUI = not FORCE_REVERSE_GUI if FORCE_REVERSE_GUI is not None else True
         # Update button visual
         try:
             self.gui_reverse_var.set(should_reverse_gui_text())
@@ -375,36 +593,48 @@ class ArabicConjugatorApp:
     def update_present_options(self):
         """Shows or hides the Bab/Mood selectors based on the selected tense."""
         if self.tense_var.get() == "Present":
-            self.present_frame.grid(row=2, column=0, columnspan=4, sticky=(tk.W, tk.E), pady=5)
+            self.present_frame.grid()
         else:
-            self.present_frame.grid_forget()
+            self.present_frame.grid_remove()
 
     def update_font_size(self, event=None):
         """Updates the font size of the output text area."""
         font_size = int(self.font_size_var.get())
-        self.output_text.configure(font=("Arial", font_size))
-        self.output_text.tag_configure("header", font=("Arial", font_size, "bold"), justify="center")
-        self.redisplay_results()
+        # Widgets using the named fonts re-render on their own, so neither the text nor the tags need touching
+        self._output_font.configure(size=font_size)
+        self._header_font.configure(size=font_size)
+        # The double-spacing gap is one line of the output font, so it follows the size
+        self.update_row_spacing()
+
+    def update_row_spacing(self):
+        """Applies the Double Spacing option as extra space below each table row."""
+        gap = self._output_font.metrics("linespace") if self.double_spacing_var.get() else 0
+        self.output_text.tag_configure("table_row", spacing3=gap)
 
     def redisplay_results(self):
         """Redisplays the last conjugation results, applying current display options."""
         if self.last_results:
-            self._display_results(self.last_title, self.last_results, self.last_term_results)
+            self._display_results(self.last_title, self.last_results)
 
-    def parse_root(self):
+    def _entry_text(self):
+        """Return the verb to conjugate: the logical value of a picked example, else the entry text."""
         if getattr(self, "_entry_logical_value", None):
-            raw = self._entry_logical_value
-        else:
-            raw = self.root_entry.get().strip()
+            return self._entry_logical_value
+        return self.root_entry.get().strip()
+
+    def parse_root(self, raw=None):
+        if raw is None:
+            raw = self._entry_text()
+        raw = normalize_input(raw)
 
         # Decide whether input is in visual/display order and needs reversing before parsing
         reverse_input = should_reverse_gui_text() and not getattr(self, "_entry_logical_value", None)
         try:
-            return ac.parse_root(raw, reverse=reverse_input)
+            return parse_root_cached(raw, reverse=reverse_input)
         except Exception as e:
             # Surface parsing errors to the GUI
             self.display_error(f"Input Error: {e}")
-            return None, None, None, None, None
+            return None
 
     def display_error(self, message):
         """Displays an error message in the output area."""
@@ -414,163 +644,173 @@ class ArabicConjugatorApp:
 
     def calculate_conjugation(self):
         """Main calculation and display function."""
-        parsed_values = self.parse_root()
-        if not parsed_values or not parsed_values[0]:
-            return
-
+        # Read the entry once; parsing and conjugation both work on this value
+        raw = normalize_input(self._entry_text())
         tense = self.tense_var.get()
-
         reverse_input = should_reverse_gui_text() and not getattr(self, "_entry_logical_value", None)
-
         if tense == "Past":
-            title, results = ac.conjugate_verb(self.root_entry.get().strip(), tense="past", reverse_input=reverse_input)
+            mood = selected_bab_key = None
         else:
             mood = self.mood_var.get()
             selected_bab_key = self.bab_var.get()
-            title, results = ac.conjugate_verb(
-                self.root_entry.get().strip(), tense="present", bab_key=selected_bab_key, mood=mood, reverse_input=reverse_input
-            )
-
-        self.last_title = title
-        self.last_results = results
-        self._display_results(title, results)
 
-    def _display_results(self, title, results):
-        """Formats and displays the 14 conjugations in the required table format."""
-        is_headless = getattr(self, "headless", False)
-
-        # Build terminal grouped results (used for both GUI and headless paths)
-        term_grouped_results = {}
-        for (pronoun, _, person_gender, num), verb in zip(self.PRONOUNS, results):
-            if person_gender not in term_grouped_results:
-                term_grouped_results[person_gender] = {}
-            if num in term_grouped_results[person_gender]:
-                term_grouped_results[person_gender][num] += f", {verb}"
-            else:
-                term_grouped_results[person_gender][num] = verb
-
-        # If running headless (CLI), emit the terminal table and return
-        if is_headless:
-            term_table_content = ""
-            term_should_reverse = should_reverse_terminal_text()
-            title_vis = format_text_terminal(title)
-            term_table_content += f"{title_vis}\n"
-            term_table_content += "=" * 77 + "\n"
-
-            display_order_term = ["3rd person male", "3rd person female", "2nd person male", "2nd person female", "1st person"]
-
-            header = "{0:^{p}} | {1:^{d}} | {2:^{s}} | {3:^{per}}\n".format(
-                "Plural",
-                "Dual",
-                "Singular",
-                "Person",
-                p=16,
-                d=13,
-                s=13,
-                per=16,
-            )
-            term_table_content += header
-            term_table_content += "-" * 77 + "\n"
-
-            def make_visual(cell):
-                if cell is None:
-                    return ""
-                cell = str(cell)
-                if cell == "---":
-                    return cell
-                if not term_should_reverse:
-                    return cell
-                return format_text_terminal(cell)
-
-            for pg in display_order_term:
-                row_data = term_grouped_results.get(pg, {})
-                plural_form = row_data.get("Plural", "---")
-                dual_form = row_data.get("Dual", "---")
-                singular_form = row_data.get("Singular", "---")
-                if pg == "1st person":
-                    dual_form = "------"
-
-                plural_vis = make_visual(plural_form)
-                dual_vis = make_visual(dual_form)
-                singular_vis = make_visual(singular_form)
-                person_vis = pg
-
-                extra = ""
-                if not should_reverse_gui_text():
-                    extra = " "
-
-                plural_col = plural_vis + "\t\t"
-                dual_col = dual_vis + extra + "  \t"
-                singular_col = singular_vis + "  \t"
-                person_col = person_vis
-
-                if not should_reverse_gui_text():
-                    extra = ""
-                else:
-                    extra = "\t"
-
-                term_table_content += f"{extra}{plural_col} l {dual_col}{extra} l {singular_col}{extra} l {person_col} \n"
-
-            term_table_content += "=" * 77 + "\n"
-            print(term_table_content)
+        # Re-submitting unchanged inputs keeps the table already on screen, unless the user has since
+        # edited the (editable) output text; _display_results clears the widget's modified flag
+        state = (raw, tense, selected_bab_key, mood, reverse_input)
+        if state == self._last_state and self.last_results is not None and not self.output_text.edit_modified():
             return
 
-        # GUI output (only when running with the real GUI widgets)
-        self.output_text.delete(1.0, tk.END)
-        # Decide whether GUI text needs reversing/reshaping based on environment
-        title_to_show = format_text_gui(title)
-
-        self.output_text.insert(tk.END, f"\n{title_to_show}\n\n", "header")
+        parsed_values = self.parse_root(raw)
+        if parsed_values is None:
+            return
 
-        # --- GUI Table ---
-        gui_grouped_results = {}
-        for (pronoun, _, person_gender, num), verb in zip(self.PRONOUNS, results):
-            if person_gender not in gui_grouped_results:
-                gui_grouped_results[person_gender] = {}
-            if num in gui_grouped_results[person_gender]:
-                gui_grouped_results[person_gender][num] += f"\n{verb}"
-            else:
-                gui_grouped_results[person_gender][num] = verb
+        if tense == "Past":
+            title, results = conjugate_verb_cached(raw, tense="past", reverse_input=reverse_input)
+        else:
+            title, results = conjugate_verb_cached(
+                raw, tense="present", bab_key=selected_bab_key, mood=mood, reverse_input=reverse_input
+            )
 
-        display_order = ["3rd person male", "3rd person female", "2nd person male", "2nd person female"]
+        self._last_state = state
+        self.last_title = title
+        self.last_results = results
+        self._display_results(title, results)
 
-        seperator_len = 24
-        that_many_spaces = "\t\t"
+    @staticmethod
+    def _group_cell(results, indices, sep):
+        """Return the form(s) at indices for one table cell, joined with sep, or "---" if the cell is empty."""
+        if not indices:
+            return "---"
+        if len(indices) == 1:
+            return results[indices[0]]
+        return sep.join(str(results[i]) for i in indices)
+
+    @classmethod
+    def _format_terminal(cls, title, results):
+        """Return the terminal (CLI) conjugation table as a single string."""
+        # Decided once per table: skip per-cell formatting when shaping is off or unavailable
+        term_should_reverse = should_reverse_terminal_text() and _load_shaping() is not None
+        title_vis = format_text_terminal(title)
+        term_parts = [f"{title_vis}\n", cls._TERM_RULE]
+
+        term_parts.append(cls._TERM_HEADER)
+        term_parts.append(cls._TERM_THIN_RULE)
+
+        def make_visual(cell):
+            if cell is None:
+                return ""
+            cell = str(cell)
+            if cell == "---":
+                return cell
+            if not term_should_reverse:
+                return cell
+            return format_text_terminal(cell)
+
+        # Column padding depends only on the GUI reversal state, so bind it into the row template once
         if should_reverse_gui_text():
-            that_many_spaces += "\t"
-            seperator_len += 6
-
-        row_ending = "\n\n" if self.double_spacing_var.get() else "\n"
-
-        gui_table_content = ""
-        separator = "—" * seperator_len + "\n"
-
-        header = f"| Plural\t| Dual\t| Singular\t|{that_many_spaces}|\n"
+            row_fmt = functools.partial(cls._TERM_ROW_FMT.format, lead="\t", pad="")
+        else:
+            row_fmt = functools.partial(cls._TERM_ROW_FMT.format, lead="", pad=" ")
+
+        for pg, (plural_idx, dual_idx, singular_idx) in cls._TABLE_LAYOUT:
+            plural_form = cls._group_cell(results, plural_idx, ", ")
+            dual_form = cls._group_cell(results, dual_idx, ", ")
+            singular_form = cls._group_cell(results, singular_idx, ", ")
+            if pg == "1st person":
+                dual_form = "------"
+
+            plural_vis = make_visual(plural_form)
+            dual_vis = make_visual(dual_form)
+            singular_vis = make_visual(singular_form)
+            term_parts.append(row_fmt(plural=plural_vis, dual=dual_vis, singular=singular_vis, person=pg))
+
+        # Trailing blank line separates the table from whatever is printed next
+        term_parts.append(cls._TERM_RULE + "\n")
+        return "".join(term_parts)
+
+    @classmethod
+    @functools.lru_cache(maxsize=64)
+    def _format_gui(cls, results, reverse):
+        """Return the GUI conjugation table as (head, rows, tail) strings; rows get the "table_row" tag.
+
+        Every part, cells included, is rendered for the given reverse state (not the global one), so the
+        cache key (results, reverse) fully describes the value and reversal flips reuse already-built text.
+        """
+        that_many_spaces, separator, header = cls._GUI_TABLE_FRAME[reverse]
 
-        gui_table_content += separator
-        gui_table_content += header
-        gui_table_content += separator
+        # Row template built once per table; only the cell values change per row
+        row_fmt = "l {0}\tl {1}\tl {2}\tl {3}" + that_many_spaces + "l\n"
 
-        for pg in display_order:
-            row_data = gui_grouped_results.get(pg, {})
-            plural_form = format_text_gui(row_data.get("Plural", "---"))
-            dual_form = format_text_gui(row_data.get("Dual", "---"))
-            singular_form = format_text_gui(row_data.get("Singular", "---"))
+        gui_parts = []
 
-            gui_table_content += f"l {plural_form}\tl {dual_form}\tl {singular_form}\tl {pg}{that_many_spaces}l{row_ending}"
+        # The "1st person" row (last) is rendered separately below since it has no dual
+        for pg, (plural_idx, dual_idx, singular_idx) in cls._TABLE_LAYOUT[:-1]:
+            plural_form = format_text_gui(cls._group_cell(results, plural_idx, "\n"), reverse)
+            dual_form = format_text_gui(cls._group_cell(results, dual_idx, "\n"), reverse)
+            singular_form = format_text_gui(cls._group_cell(results, singular_idx, "\n"), reverse)
 
-        row_data_1st = gui_grouped_results.get("1st person", {})
-        plural_form = format_text_gui(row_data_1st.get("Plural", "---"))
-        singular_form = format_text_gui(row_data_1st.get("Singular", "---"))
+            gui_parts.append(row_fmt.format(plural_form, dual_form, singular_form, pg))
 
-        gui_table_content += f"l\t {plural_form}\tl {singular_form}\tl 1st person{that_many_spaces}l{row_ending}"
+        _, (plural_idx, _, singular_idx) = cls._TABLE_LAYOUT[-1]
+        plural_form = format_text_gui(cls._group_cell(results, plural_idx, "\n"), reverse)
+        singular_form = format_text_gui(cls._group_cell(results, singular_idx, "\n"), reverse)
 
-        gui_table_content += separator
+        gui_parts.append(f"l\t {plural_form}\tl {singular_form}\tl 1st person{that_many_spaces}l\n")
+        return separator + header + separator, "".join(gui_parts), separator
 
-        self.output_text.insert(tk.END, gui_table_content)
+    def _display_results(self, title, results):
+        """Formats and displays the 14 conjugations in the required table format."""
+        # If running headless (CLI), emit the terminal table and return
+        if getattr(self, "headless", False):
+            write_stdout(self._format_terminal(title, results))
+            return
 
+        # GUI output (only when running with the real GUI widgets)
+        self.output_text.delete(1.0, tk.END)
+        # Decide whether GUI text needs reversing/reshaping based on environment
+        title_to_show = format_text_gui(title)
 
-if __name__ == "__main__":
+        head, rows, tail = self._format_gui(tuple(results), should_reverse_gui_text())
+
+        # Title (tagged "header") and table go to Tk in a single insert call
+        self.output_text.insert(tk.END, f"\n{title_to_show}\n\n", "header", head, "", rows, "table_row", tail)
+        # Mark the freshly rendered table as unmodified so later user edits can be detected
+        self.output_text.edit_modified(False)
+
+
+# CLI shorthand -> internal BABS keys (read-only, built once at import)
+_BAB_SHORTHAND = types.MappingProxyType({
+    "f_f": "Fatha/Fatha (فَتَحَ / يَفْتَحُ)",
+    "f_d": "Fatha/Damma (نَصَرَ / يَنْصُرُ)",
+    "f_k": "Fatha/Kasra (ضَرَبَ / يَضْرِبُ)",
+    "k_f": "Kasra/Fatha (سَمِعَ / يَسْمَعُ)",
+    "d_d": "Damma/Damma (كَرُمَ / يَكْرُمُ)",
+    "k_k": "Kasra/Kasra (حَسِبَ / يَحْسِبُ)",
+})
+
+# CLI mood names/abbreviations -> internal MOODS values
+_MOOD_SHORTHAND = types.MappingProxyType({
+    "indicative": "Indicative (مرفوع)",
+    "i": "Indicative (مرفوع)",
+    "subjunctive": "Subjunctive (منصوب)",
+    "s": "Subjunctive (منصوب)",
+    "imperative": "Imperative (أمر)",
+    "imp": "Imperative (أمر)",
+    "jussive": "Jussive (مجزوم)",
+    "j": "Jussive (مجزوم)",
+})
+
+# Printed when GUI mode is requested but tkinter cannot be imported
+_TK_MISSING_HELP = (
+    "Tkinter is not available. To use GUI mode, please install tkinter or run with CLI arguments.\n\n"
+    "Example CLI usage:\n"
+    '  python3 arabic_verb_conjugator.py --verb "ذَهَبَ" --tense past\n'
+)
+
+
+def main():
+    """Entry point: run the CLI when arguments are given, otherwise launch the GUI. Returns the exit code."""
+    global FORCE_REVERSE_TERMINAL
     # If user explicitly requests help, print a friendly, professional help message
     if any(h in sys.argv for h in ("--help", "-h")):
         help_text = r"""
@@ -595,10 +835,15 @@ Options:
                                              k_k: Kasra/Kasra
     --mood <indicative|i|subjunctive|s>
                                              Mood for present tense (default: indicative)
+    --batch <FILE>      UTF-8 file with one verb per line, conjugated in a single run with the
+                                             same --tense/--mood; with --tense present a line may add
+                                             a bab shorthand after the verb (e.g. "كَتَبَ f_d") to
+                                             override --bab (alias: --verbs-file; not with --verb)
 
 Examples:
     python3 arabic_verb_conjugator.py --verb "فَعَلَ"
     python3 arabic_verb_conjugator.py --verb "كَتَبَ" --tense present --bab f_d --mood i
+    python3 arabic_verb_conjugator.py --batch verbs.txt --tense present --bab f_d
 
     Terminal reversal control:
         --force-reverse-terminal
@@ -617,11 +862,13 @@ Notes:
 
 """
         print(help_text)
-        sys.exit(0)
+        return 0
 
     # --- CLI handling ---
     parser = argparse.ArgumentParser(description="Arabic Verb Conjugator - CLI mode")
-    parser.add_argument("--verb", dest="verb", help="Past tense verb (3 letters with harakat), e.g., ذَهَبَ")
+    # A single verb or a batch file, not both
+    verb_source = parser.add_mutually_exclusive_group()
+    verb_source.add_argument("--verb", dest="verb", help="Past tense verb (3 letters with harakat), e.g., ذَهَبَ")
     parser.add_argument("--tense", dest="tense", choices=["past", "present"], default="past", help="Tense: past or present (default: past)")
     parser.add_argument(
         "--bab",
@@ -637,6 +884,14 @@ Notes:
         default="indicative",
         help="Mood for present tense: indicative (i), subjunctive (s), imperative (imp), or jussive (j). Default: indicative",
     )
+    verb_source.add_argument(
+        "--batch",
+        "--verbs-file",
+        dest="batch",
+        metavar="FILE",
+        help="UTF-8 file with one verb per line (with --tense present, optionally followed by a bab shorthand) "
+        "to conjugate in a single run",
+    )
     # Allow user to force terminal reversal behavior from CLI
     parser.add_argument(
         "--force-reverse-terminal",
@@ -657,49 +912,26 @@ Notes:
     cli_mode = any([args.verb, len(sys.argv) > 1])
 
     if cli_mode:
-        # Map bab shorthand to internal BABS keys
-        bab_map = {
-            "f_f": "Fatha/Fatha (فَتَحَ / يَفْتَحُ)",
-            "f_d": "Fatha/Damma (نَصَرَ / يَنْصُرُ)",
-            "f_k": "Fatha/Kasra (ضَرَبَ / يَضْرِبُ)",
-            "k_f": "Kasra/Fatha (سَمِعَ / يَسْمَعُ)",
-            "d_d": "Damma/Damma (كَرُمَ / يَكْرُمُ)",
-            "k_k": "Kasra/Kasra (حَسِبَ / يَحْسِبُ)",
-        }
-
-        mood_map = {
-            "indicative": "Indicative (مرفوع)",
-            "i": "Indicative (مرفوع)",
-            "subjunctive": "Subjunctive (منصوب)",
-            "s": "Subjunctive (منصوب)",
-            "imperative": "Imperative (أمر)",
-            "imp": "Imperative (أمر)",
-            "jussive": "Jussive (مجزوم)",
-            "j": "Jussive (مجزوم)",
-        }
-
         # Create a minimal headless app instance without initializing tkinter widgets.
         # We'll instantiate ArabicConjugatorApp but bypass GUI setup by creating a dummy master
         class _HeadlessApp(ArabicConjugatorApp):
             def __init__(self):
                 # Do not call super().__init__ to avoid GUI initialization
                 # Instead, initialize only the attributes used by conjugation logic
-                # Copy constants from parent class
-                for k, v in ArabicConjugatorApp.__dict__.items():
-                    if k.isupper():
-                        setattr(self, k, v)
+                # (class constants such as PRONOUNS/BABS resolve through the class)
 
                 # Minimal attributes used by parsing/conjugation/display
                 self.last_results = None
-                self.last_term_results = None
                 self.last_title = ""
-                self.double_spacing_var = type("X", (), {"get": lambda self: False})()
                 # Mark as headless so display method knows to skip GUI inserts
                 self.headless = True
+                # Where parse errors go; batch mode points this at stderr with a file:line prefix
+                self.error_stream = sys.stdout
+                self.error_prefix = ""
 
             # Provide dummy methods expected by the class but not needed in CLI
             def display_error(self, message):
-                print(message)
+                print(f"{self.error_prefix}{message}", file=self.error_stream)
 
             # Override _display_results to reuse existing function body but avoid GUI widgets.
             # We'll call the original _display_results which mostly prints to terminal.
@@ -707,20 +939,21 @@ Notes:
 
         # Respect CLI override for terminal reversal when creating headless app
         if args.force_reverse_terminal:
-            globals()["FORCE_REVERSE_TERMINAL"] = True
+            FORCE_REVERSE_TERMINAL = True
         elif args.no_reverse_terminal:
-            globals()["FORCE_REVERSE_TERMINAL"] = False
+            FORCE_REVERSE_TERMINAL = False
 
         app = _HeadlessApp()
 
-        # If verb not provided, show usage and exit
-        if not args.verb:
+        # If neither a verb nor a batch file was provided, show usage and exit
+        if not args.verb and not args.batch:
             parser.print_help()
-            sys.exit(1)
+            return 1
 
         # Prepare inputs
-        verb_input = args.verb
         tense = args.tense.lower()
+        bab_key = _BAB_SHORTHAND.get(args.bab, ArabicConjugatorApp._DEFAULT_BAB)
+        mood = _MOOD_SHORTHAND.get(args.mood, ArabicConjugatorApp._DEFAULT_MOOD)
 
         # parse_root expects the entry widget; monkeypatch root_entry.get to return the verb
         class DummyEntry:
@@ -730,58 +963,78 @@ Notes:
             def get(self):
                 return self._v
 
-        app.root_entry = DummyEntry(verb_input)
+        # Whether input is in visual/display order (same logic as GUI); fixed for the whole run since the
+        # CLI never sets a logical entry value
+        reverse_input = should_reverse_gui_text()
 
-        if tense == "past":
+        def conjugate_cli_verb(verb, bab_key=bab_key):
+            """Validate and conjugate one verb with the CLI tense/bab/mood. Returns None on a parse error."""
+            verb = normalize_input(verb)
+            app.root_entry = DummyEntry(verb)
             # Validate input using the parser for helpful feedback, then call the high-level API
             parsed = app.parse_root()
-            if not parsed or not parsed[0]:
-                sys.exit(1)
-            # Determine if input was in visual/display order (same logic as GUI)
-            reverse_input = should_reverse_gui_text() and not getattr(app, "_entry_logical_value", None)
-            title, results = ac.conjugate_verb(verb_input, tense="past", reverse_input=reverse_input)
-        else:
-            # Present
-            bab_key = bab_map.get(args.bab, list(ArabicConjugatorApp.BABS.keys())[0])
-            mood = mood_map.get(args.mood, "Indicative (مرفوع)")
-            parsed = app.parse_root()
-            if not parsed or not parsed[0]:
-                sys.exit(1)
-            reverse_input = should_reverse_gui_text() and not getattr(app, "_entry_logical_value", None)
-            title, results = ac.conjugate_verb(verb_input, tense="present", bab_key=bab_key, mood=mood, reverse_input=reverse_input)
-
-        # Reuse existing terminal print logic in _display_results by calling it.
-        # But _display_results uses self.output_text which doesn't exist in headless mode.
-        # Instead, call the terminal-only portion of that code by temporarily setting
-        # attributes it expects.
-
-        # Attach minimal attributes used by _display_results
-        app.PRONOUNS = ArabicConjugatorApp.PRONOUNS
-
-        class DummyText:
-            def delete(self, a, b=None):
-                return
-
-            def insert(self, index, text, tag=None):
-                # Print header and GUI table content to stdout as fallback
-                print(text, end="")
-
-            def tag_configure(self, *args, **kwargs):
-                return
-
-        app.output_text = DummyText()
-        app._display_results(title, results)
-
-        sys.exit(0)
+            if parsed is None:
+                return None
+            if tense == "past":
+                return conjugate_verb_cached(verb, tense="past", reverse_input=reverse_input)
+            return conjugate_verb_cached(verb, tense="present", bab_key=bab_key, mood=mood, reverse_input=reverse_input)
+
+        if args.batch:
+            try:
+                with open(args.batch, encoding="utf-8") as batch_file:
+                    batch_lines = batch_file.readlines()
+            except OSError as e:
+                print(f"Could not read batch file: {e}", file=sys.stderr)
+                return 1
+
+            # Collect every table and write them once at the end; errors go to stderr as they occur
+            app.error_stream = sys.stderr
+            output_parts = []
+            had_errors = False
+            for lineno, line in enumerate(batch_lines, start=1):
+                fields = line.split()
+                if not fields:
+                    continue
+                app.error_prefix = f"{args.batch}:{lineno}: "
+                # "verb [bab]": an optional bab shorthand overrides --bab for this line (present tense only)
+                line_bab_key = bab_key
+                if len(fields) > 1:
+                    line_bab_key = _BAB_SHORTHAND.get(fields[1])
+                    if len(fields) > 2 or line_bab_key is None:
+                        app.display_error(f"Input Error: expected 'VERB [BAB]' with BAB one of {', '.join(_BAB_SHORTHAND)}")
+                        had_errors = True
+                        continue
+                    if tense == "past":
+                        app.display_error("Input Error: a per-line bab is only used with --tense present")
+                        had_errors = True
+                        continue
+                conjugated = conjugate_cli_verb(fields[0], line_bab_key)
+                if conjugated is None:
+                    had_errors = True
+                    continue
+                output_parts.append(ArabicConjugatorApp._format_terminal(*conjugated))
+            write_stdout("".join(output_parts))
+            return 1 if had_errors else 0
+
+        conjugated = conjugate_cli_verb(args.verb)
+        if conjugated is None:
+            return 1
+
+        # Render the terminal table directly; no GUI widgets are involved
+        write_stdout(ArabicConjugatorApp._format_terminal(*conjugated))
+
+        return 0
 
     # No CLI args -> GUI mode required
-    if tk is None:
-        print("Tkinter is not available. To use GUI mode, please install tkinter or run with CLI arguments.\n")
-        parser = argparse.ArgumentParser(add_help=False)
-        parser.add_argument("--help", action="help", help=argparse.SUPPRESS)
-        print('Example CLI usage:\n  python3 arabic_verb_conjugator.py --verb "ذَهَبَ" --tense past')
-        sys.exit(1)
+    if not _load_tkinter():
+        sys.stderr.write(_TK_MISSING_HELP)
+        return 1
 
     root = tk.Tk()
     app = ArabicConjugatorApp(root)
     root.mainloop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())